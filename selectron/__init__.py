@@ -85,6 +85,7 @@ from .discovery import (
     PortConflictHandler,
     get_devtools_info,
     get_devtools_targets,
+    close_devtools_connections,
 )
 
 # App Scanner
@@ -139,6 +140,7 @@ __all__ = [
     "PortConflictHandler",
     "get_devtools_info",
     "get_devtools_targets",
+    "close_devtools_connections",
 
     # App Scanner
     "ElectronApp",
@@ -80,6 +80,7 @@ class SelectronConfig:
         default_app: Default application name (from SELECTRON_DEFAULT_APP)
         search_dirs: Set of directories to search for applications
         sessions_file: Path to the sessions persistence file
+        versions_file: Path to the Chrome version / ChromeDriver cache file
         port_scan_range: Port range for scanning (start, end inclusive)
     """
     default_app: Optional[str] = None
@@ -87,6 +88,9 @@ class SelectronConfig:
     sessions_file: Path = field(
         default_factory=lambda: Path.home() / ".selectron" / "sessions.json"
     )
+    versions_file: Path = field(
+        default_factory=lambda: Path.home() / ".selectron" / "versions.json"
+    )
     port_scan_range: tuple = DEFAULT_PORT_RANGE
 
     @classmethod
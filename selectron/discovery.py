@@ -4,17 +4,137 @@ Selectron Session Discovery
 Port scanning and external session detection for Chrome DevTools Protocol.
 """
 
+import asyncio
+import http.client
 import json
+import os
+import re
 import socket
+import threading
+import time
 import uuid
-import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable, Tuple
+from functools import partial
+from itertools import repeat
+from typing import Optional, List, Dict, Any, Callable, Collection, Tuple
 
 from .models import Session, SessionOrigin, SessionStatus
 from .registry import SessionRegistry, get_registry
 from .config import get_config
-from .utils import is_port_in_use
+from .utils import is_port_in_use, find_ports_in_use, LIVENESS_TIMEOUT
+
+
+# (pattern, template) rules tried in order by SessionDiscovery._guess_app_name()
+APP_NAME_RULES = (
+    (re.compile(r"electron", re.IGNORECASE), "Electron App (port {port})"),
+    (re.compile(r"chrome/(?P<version>\d+)", re.IGNORECASE), "Chrome {version} (port {port})"),
+    (re.compile(r"chrome", re.IGNORECASE), "Chrome (port {port})"),
+    (re.compile(r"chromium", re.IGNORECASE), "Chromium (port {port})"),
+)
+
+# Largest /json/version response _raw_devtools_probe() will read; real ones
+# are well under 1KB
+MAX_PROBE_RESPONSE = 64 * 1024
+
+_CONTENT_LENGTH_RE = re.compile(rb"^content-length:\s*(\d+)\s*$", re.IGNORECASE | re.MULTILINE)
+
+# Failures that mean "no usable DevTools endpoint" (timeouts and resets are
+# OSErrors; malformed JSON is a ValueError)
+DEVTOOLS_ERRORS = (OSError, http.client.HTTPException, ValueError)
+
+# Keep-alive connections each thread keeps to DevTools endpoints; the least
+# recently used is closed beyond this many
+DEVTOOLS_POOL_SIZE = 8
+
+# Pooled connections idle for longer than this (seconds) are closed the next
+# time the thread makes a DevTools request
+DEVTOOLS_IDLE_TIMEOUT = 10.0
+
+# Per-thread keep-alive connections to DevTools endpoints:
+# (host, port) -> (connection, last-used monotonic time), oldest first
+_http_local = threading.local()
+
+
+def _get_connection(host: str, port: int, timeout: float) -> http.client.HTTPConnection:
+    """Get this thread's pooled connection to a DevTools endpoint."""
+    connections = getattr(_http_local, "connections", None)
+    if connections is None:
+        connections = _http_local.connections = OrderedDict()
+
+    now = time.monotonic()
+    for key, (idle_conn, last_used) in list(connections.items()):
+        if now - last_used > DEVTOOLS_IDLE_TIMEOUT:
+            del connections[key]
+            idle_conn.close()
+
+    if entry := connections.pop((host, port), None):
+        conn = entry[0]
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        while len(connections) >= DEVTOOLS_POOL_SIZE:
+            connections.popitem(last=False)[1][0].close()
+
+    connections[(host, port)] = (conn, now)
+    return conn
+
+
+def _discard_connection(host: str, port: int) -> None:
+    """Close and forget this thread's pooled connection to a port."""
+    connections = getattr(_http_local, "connections", {})
+    if entry := connections.pop((host, port), None):
+        entry[0].close()
+
+
+def close_devtools_connections() -> None:
+    """
+    Close the calling thread's pooled DevTools connections.
+
+    get_devtools_info() and get_devtools_targets() keep connections open for
+    reuse; long-running callers can release them once they are done polling.
+    """
+    connections = getattr(_http_local, "connections", {})
+    while connections:
+        connections.popitem()[1][0].close()
+
+
+def _devtools_get(path: str, port: int, host: str, timeout: float) -> Optional[Any]:
+    """
+    GET a DevTools JSON endpoint over a reused keep-alive connection.
+
+    Returns:
+        Decoded JSON body, or None if the response is not a 200
+
+    Raises:
+        OSError, http.client.HTTPException, ValueError: If the request fails
+            (a closed port raises ConnectionRefusedError)
+    """
+    conn = _get_connection(host, port, timeout)
+    try:
+        for attempt in range(2):
+            reused = conn.sock is not None
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server may have closed an idle keep-alive connection;
+                # retry once on a fresh one
+                conn.close()
+                if not reused or attempt:
+                    raise
+    except Exception:
+        _discard_connection(host, port)
+        raise
+
+    if response.status != 200:
+        return None
+    return json.loads(body)
 
 
 def get_devtools_info(port: int, host: str = "localhost", timeout: float = 1.0) -> Optional[Dict[str, Any]]:
@@ -30,10 +150,8 @@ def get_devtools_info(port: int, host: str = "localhost", timeout: float = 1.0)
         Dict with version info, or None if port doesn't respond to DevTools protocol
     """
     try:
-        url = f"http://{host}:{port}/json/version"
-        with urllib.request.urlopen(url, timeout=timeout) as response:
-            return json.loads(response.read().decode())
-    except Exception:
+        return _devtools_get("/json/version", port, host, timeout)
+    except DEVTOOLS_ERRORS:
         return None
 
 
@@ -50,23 +168,135 @@ def get_devtools_targets(port: int, host: str = "localhost", timeout: float = 1.
         List of target dicts, or None if port doesn't respond
     """
     try:
-        url = f"http://{host}:{port}/json/list"
-        with urllib.request.urlopen(url, timeout=timeout) as response:
-            return json.loads(response.read().decode())
-    except Exception:
+        return _devtools_get("/json/list", port, host, timeout)
+    except DEVTOOLS_ERRORS:
+        return None
+
+
+def _devtools_request_bytes(host: str, port: int, path: str = "/json/version") -> bytes:
+    """Build a minimal one-shot HTTP GET for a DevTools endpoint."""
+    return (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode()
+
+
+def _parse_devtools_response(raw: bytes) -> Optional[Any]:
+    """
+    Parse a raw HTTP response from a DevTools endpoint.
+
+    Returns:
+        Decoded JSON body, or None if the response is not a 200 with JSON
+    """
+    head, sep, body = raw.partition(b"\r\n\r\n")
+    if not sep:
+        return None
+    status_line = head.split(b"\r\n", 1)[0].split(b" ", 2)
+    if len(status_line) < 2 or status_line[1] != b"200":
+        return None
+    try:
+        return json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError):
         return None
 
 
+def _raw_devtools_probe(port: int, host: str, timeout: float) -> Optional[Any]:
+    """
+    Fetch /json/version over a raw socket.
+
+    Skips http.client's per-request object and header machinery, which adds
+    up across a scan; get_devtools_info() remains the API for one-shot
+    callers. The connect doubles as the liveness check.
+
+    Reading stops once Content-Length bytes of body have arrived, so servers
+    that keep the connection open despite "Connection: close" still work.
+    The whole exchange, connect included, is bounded by timeout and
+    MAX_PROBE_RESPONSE.
+    """
+    deadline = time.monotonic() + timeout
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        if s.connect_ex((host, port)) != 0:
+            return None
+
+        buf = bytearray()
+        header_end = -1
+        expected: Optional[int] = None
+        try:
+            s.sendall(_devtools_request_bytes(host, port))
+            while expected is None or len(buf) < expected:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or len(buf) > MAX_PROBE_RESPONSE:
+                    return None
+                s.settimeout(remaining)
+                if not (chunk := s.recv(65536)):
+                    break
+                buf += chunk
+                if header_end < 0 and (header_end := buf.find(b"\r\n\r\n")) >= 0:
+                    if match := _CONTENT_LENGTH_RE.search(buf, 0, header_end):
+                        expected = header_end + 4 + int(match.group(1))
+        except OSError:
+            return None
+
+    return _parse_devtools_response(bytes(buf[:expected]))
+
+
+def _session_info(port: int, info: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the scan result for a port that answered the DevTools protocol."""
+    return {
+        "port": port,
+        "info": info,
+        "browser": info.get("Browser", "Unknown"),
+        "protocol_version": info.get("Protocol-Version"),
+        "webkit_version": info.get("WebKit-Version"),
+        "user_agent": info.get("User-Agent"),
+    }
+
+
+def _uuid4_batch(count: int) -> List[str]:
+    """Generate random UUID4 strings from a single urandom read."""
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)]
+
+
+def _probe_port(port: int, host: str, timeout: float) -> Optional[Dict[str, Any]]:
+    """Fetch DevTools info from a port that is known to be listening."""
+    info = _raw_devtools_probe(port, host, timeout)
+    if not isinstance(info, dict):
+        return None
+    return _session_info(port, info)
+
+
 def scan_for_sessions(
     port_range: Optional[Tuple[int, int]] = None,
     host: str = "localhost",
+    timeout: float = 1.0,
+    max_workers: int = 64,
+    skip_ports: Collection[int] = (),
+    processes: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Scan a range of ports for active Chrome DevTools sessions.
 
+    Liveness is checked for the whole range at once; only open ports are then
+    probed for DevTools, in parallel on a thread pool. This is safe to call
+    from any thread. Asyncio callers should await scan_for_sessions_async().
+
     Args:
         port_range: (start, end) port range inclusive (uses config default if None)
         host: Host to scan (default: localhost)
+        timeout: Per-port connect and DevTools request timeout in seconds.
+                 Closed local ports are refused at once, so this only
+                 matters for remote hosts and unresponsive ports.
+        max_workers: Number of parallel probe threads
+        skip_ports: Ports to leave unprobed (e.g. already registered)
+        processes: Split the range across this many worker processes.
+                   Only worth it for very large ranges: each worker costs
+                   tens of milliseconds to start, and with the "spawn" start
+                   method (the macOS default) the calling script needs an
+                   ``if __name__ == "__main__"`` guard.
 
     Returns:
         List of dicts with port and devtools info for each discovered session
@@ -74,20 +304,85 @@ def scan_for_sessions(
     config = get_config()
     start_port, end_port = port_range or config.port_scan_range
 
-    discovered = []
-    for port in range(start_port, end_port + 1):
-        if is_port_in_use(port, host):
-            if info := get_devtools_info(port, host):
-                discovered.append({
-                    "port": port,
-                    "info": info,
-                    "browser": info.get("Browser", "Unknown"),
-                    "protocol_version": info.get("Protocol-Version"),
-                    "webkit_version": info.get("WebKit-Version"),
-                    "user_agent": info.get("User-Agent"),
-                })
+    if processes and processes > 1 and end_port > start_port:
+        chunk_size = -(-(end_port - start_port + 1) // processes)
+        chunks = [
+            (chunk_start, min(chunk_start + chunk_size - 1, end_port))
+            for chunk_start in range(start_port, end_port + 1, chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(
+                _scan_chunk,
+                chunks,
+                repeat(host),
+                repeat(timeout),
+                repeat(max_workers),
+                repeat(frozenset(skip_ports)),
+            )
+            return [found for chunk in results for found in chunk]
 
-    return discovered
+    ports = [port for port in range(start_port, end_port + 1) if port not in skip_ports]
+
+    live_ports = find_ports_in_use(ports, host, timeout)
+    to_probe = [port for port in ports if port in live_ports]
+
+    probed: Dict[int, Optional[Dict[str, Any]]] = {}
+    if to_probe:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_probe))) as executor:
+            probed = dict(zip(
+                to_probe,
+                executor.map(lambda port: _probe_port(port, host, timeout), to_probe),
+            ))
+
+    return [probed[port] for port in to_probe if probed[port]]
+
+
+def _scan_chunk(
+    port_range: Tuple[int, int],
+    host: str,
+    timeout: float,
+    max_workers: int,
+    skip_ports: Collection[int],
+) -> List[Dict[str, Any]]:
+    """Scan one sub-range in a worker process (module-level so it pickles)."""
+    return scan_for_sessions(port_range, host, timeout, max_workers, skip_ports)
+
+
+async def scan_for_sessions_async(
+    port_range: Optional[Tuple[int, int]] = None,
+    host: str = "localhost",
+    timeout: float = 1.0,
+    max_workers: int = 64,
+    skip_ports: Collection[int] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Awaitable scan_for_sessions() for asyncio applications.
+
+    Runs the same scan on the loop's default executor so the event loop is
+    never blocked.
+
+    Args:
+        port_range: (start, end) port range inclusive (uses config default if None)
+        host: Host to scan (default: localhost)
+        timeout: Per-port connect and DevTools request timeout in seconds
+        max_workers: Number of parallel probe threads
+        skip_ports: Ports to leave unprobed (e.g. already registered)
+
+    Returns:
+        List of dicts with port and devtools info for each discovered session
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        partial(
+            scan_for_sessions,
+            port_range,
+            host,
+            timeout,
+            max_workers,
+            skip_ports=skip_ports,
+        ),
+    )
 
 
 class SessionDiscovery:
@@ -112,6 +407,13 @@ class SessionDiscovery:
         """
         self._registry = registry or get_registry()
         self._scanned_at: Optional[datetime] = None
+        self._default_port_range: Tuple[int, int] = get_config().port_scan_range
+
+        # Serializes scan_and_register() so overlapping callers (threads,
+        # executors, the warm_scan thread) don't probe and register the
+        # same ports twice
+        self._scan_lock = threading.Lock()
+        self._warm_scan_thread: Optional[threading.Thread] = None
 
     @property
     def last_scan_time(self) -> Optional[datetime]:
@@ -121,57 +423,170 @@ class SessionDiscovery:
     def scan_and_register(
         self,
         port_range: Optional[Tuple[int, int]] = None,
+        host: str = "localhost",
     ) -> List[Session]:
         """
         Scan for external sessions and register them.
 
         Only registers sessions that are not already in the registry.
+        Safe to call from several threads; concurrent calls run one at a time.
 
         Args:
             port_range: (start, end) port range to scan
+                        (uses the configured range if None)
+            host: Host to scan (default: localhost)
 
         Returns:
             List of newly discovered and registered sessions
         """
-        discovered_sessions = []
-
-        for found in scan_for_sessions(port_range):
-            port = found["port"]
-
-            # Check if we already know about this port
-            if self._registry.get_by_port(port):
-                continue
-
-            # Extract app name from browser string if possible
-            browser = found["browser"]
-            app_name = self._guess_app_name(browser, port)
-
-            session = Session(
-                session_id=str(uuid.uuid4()),
-                port=port,
-                app_name=app_name,
-                pid=None,  # Unknown for external sessions
-                started_at=datetime.now(),
-                started_by="external",
-                origin=SessionOrigin.EXTERNAL,
-                status=SessionStatus.RUNNING,
-                metadata={
-                    "browser": browser,
-                    "protocol_version": found.get("protocol_version"),
-                    "webkit_version": found.get("webkit_version"),
-                    "user_agent": found.get("user_agent"),
-                    "discovered_at": datetime.now().isoformat(),
-                },
+        with self._scan_lock:
+            discovered_sessions = []
+            now = datetime.now()
+            now_iso = now.isoformat()
+
+            # Don't probe ports we already know about
+            found_sessions = scan_for_sessions(
+                port_range or self._default_port_range,
+                host,
+                skip_ports=self._registry.known_ports_snapshot(),
             )
 
-            try:
-                self._registry.register(session)
-                discovered_sessions.append(session)
-            except Exception as e:
-                print(f"Warning: Could not register session on port {port}: {e}")
+            # Recheck against a fresh snapshot in case one registered mid-scan
+            known_ports = self._registry.known_ports_snapshot()
+            new_found = [found for found in found_sessions if found["port"] not in known_ports]
+
+            for found, session_id in zip(new_found, _uuid4_batch(len(new_found))):
+                if session := self._register_found(found, session_id, now, now_iso):
+                    discovered_sessions.append(session)
+
+            self._scanned_at = now
+            return discovered_sessions
+
+    async def scan_and_register_async(
+        self,
+        port_range: Optional[Tuple[int, int]] = None,
+        host: str = "localhost",
+    ) -> List[Session]:
+        """
+        Awaitable scan_and_register() for asyncio applications.
+
+        The scan and the registry writes (which persist to disk) run on the
+        loop's default executor so the event loop is never blocked.
+        Overlapping awaits are serialized by scan_and_register()'s lock.
+
+        Args:
+            port_range: (start, end) port range to scan
+                        (uses the configured range if None)
+            host: Host to scan (default: localhost)
+
+        Returns:
+            List of newly discovered and registered sessions
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.scan_and_register, port_range, host)
 
-        self._scanned_at = datetime.now()
-        return discovered_sessions
+    def _register_found(
+        self,
+        found: Dict[str, Any],
+        session_id: str,
+        now: datetime,
+        now_iso: str,
+    ) -> Optional[Session]:
+        """
+        Build and register an external session from a scan result.
+
+        Returns:
+            The registered session, or None if registration failed
+        """
+        port = found["port"]
+
+        # Extract app name from browser string if possible
+        browser = found["browser"]
+        app_name = self._guess_app_name(browser, port)
+
+        session = Session(
+            session_id=session_id,
+            port=port,
+            app_name=app_name,
+            pid=None,  # Unknown for external sessions
+            started_at=now,
+            started_by="external",
+            origin=SessionOrigin.EXTERNAL,
+            status=SessionStatus.RUNNING,
+            metadata={
+                "browser": browser,
+                "protocol_version": found.get("protocol_version"),
+                "webkit_version": found.get("webkit_version"),
+                "user_agent": found.get("user_agent"),
+                "discovered_at": now_iso,
+            },
+        )
+
+        try:
+            self._registry.register(session)
+            return session
+        except Exception as e:
+            print(f"Warning: Could not register session on port {port}: {e}")
+            return None
+
+    def warm_scan(
+        self,
+        port_range: Optional[Tuple[int, int]] = None,
+        host: str = "localhost",
+        background: bool = True,
+    ) -> List[Session]:
+        """
+        Revalidate sessions persisted by a previous run, then do a full scan.
+
+        Sessions loaded from disk start with UNKNOWN status; the registry's
+        verify_sessions() checks their ports in one bulk liveness sweep, so
+        known sessions are usable almost immediately. The full range scan
+        then runs on a daemon thread (or inline if background is False) to
+        pick up anything new. While a background scan is still running, no
+        second one is started; use wait_for_warm_scan() to block until its
+        sessions are registered.
+
+        Args:
+            port_range: (start, end) port range for the full scan
+            host: Host to scan (default: localhost)
+            background: Run the full scan on a background thread
+
+        Returns:
+            Sessions that are running after revalidation
+        """
+        self._registry.verify_sessions()
+
+        if background:
+            if self._warm_scan_thread is not None and self._warm_scan_thread.is_alive():
+                return self._registry.get_running_sessions()
+            self._warm_scan_thread = threading.Thread(
+                target=self.scan_and_register,
+                args=(port_range, host),
+                name="SelectronWarmScan",
+                daemon=True,
+            )
+            self._warm_scan_thread.start()
+        else:
+            self.scan_and_register(port_range, host)
+
+        return self._registry.get_running_sessions()
+
+    def wait_for_warm_scan(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a background scan started by warm_scan() to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if no background scan is still running
+        """
+        if self._warm_scan_thread is not None:
+            self._warm_scan_thread.join(timeout)
+            if self._warm_scan_thread.is_alive():
+                return False
+            self._warm_scan_thread = None
+        return True
 
     def rescan(self, port_range: Optional[Tuple[int, int]] = None) -> List[Session]:
         """
@@ -181,18 +596,27 @@ class SessionDiscovery:
         """
         return self.scan_and_register(port_range)
 
-    def scan_single_port(self, port: int) -> Optional[Session]:
+    def scan_single_port(self, port: int, host: str = "localhost") -> Optional[Session]:
         """
         Scan a single port and register if found.
 
+        Probes the port directly rather than running a full range scan.
+
         Args:
             port: Port to scan
+            host: Host to scan (default: localhost)
 
         Returns:
             Session if discovered and registered, None otherwise
         """
-        sessions = self.scan_and_register(port_range=(port, port))
-        return sessions[0] if sessions else None
+        if port in self._registry.known_ports_snapshot():
+            return None
+
+        if not (found := _probe_port(port, host, timeout=1.0)):
+            return None
+
+        now = datetime.now()
+        return self._register_found(found, str(uuid.uuid4()), now, now.isoformat())
 
     def _guess_app_name(self, browser_string: str, port: int) -> str:
         """
@@ -207,21 +631,10 @@ class SessionDiscovery:
         Returns:
             Guessed app name
         """
-        browser_lower = browser_string.lower()
-
-        # Common patterns
-        if "electron" in browser_lower:
-            return f"Electron App (port {port})"
-        elif "chrome" in browser_lower:
-            # Extract version if available
-            if "/" in browser_string:
-                version = browser_string.split("/")[1].split(".")[0]
-                return f"Chrome {version} (port {port})"
-            return f"Chrome (port {port})"
-        elif "chromium" in browser_lower:
-            return f"Chromium (port {port})"
-        else:
-            return f"Unknown (port {port})"
+        for pattern, template in APP_NAME_RULES:
+            if match := pattern.search(browser_string):
+                return template.format(port=port, **match.groupdict())
+        return f"Unknown (port {port})"
 
 
 # Action types for port conflict resolution
@@ -230,6 +643,27 @@ CONFLICT_ACTION_IGNORE = "ignore"  # Ignore and continue
 CONFLICT_ACTION_KILL = "kill"      # Kill existing and take over
 CONFLICT_ACTION_CANCEL = "cancel"  # Cancel the operation
 
+# Answers accepted by default_conflict_prompt()
+CONFLICT_PROMPT_CHOICES = {
+    "a": CONFLICT_ACTION_ADD,
+    "add": CONFLICT_ACTION_ADD,
+    "i": CONFLICT_ACTION_IGNORE,
+    "ignore": CONFLICT_ACTION_IGNORE,
+    "k": CONFLICT_ACTION_KILL,
+    "kill": CONFLICT_ACTION_KILL,
+    "c": CONFLICT_ACTION_CANCEL,
+    "cancel": CONFLICT_ACTION_CANCEL,
+    "": CONFLICT_ACTION_CANCEL,
+}
+
+CONFLICT_PROMPT_OPTIONS = (
+    "\nOptions:\n"
+    "  [a]dd    - Add to registry and track\n"
+    "  [i]gnore - Proceed without tracking\n"
+    "  [k]ill   - Kill existing and take over\n"
+    "  [c]ancel - Abort operation"
+)
+
 
 class PortConflictHandler:
     """
@@ -281,15 +715,16 @@ class PortConflictHandler:
         if existing:
             return (False, existing)
 
-        # Then check if port is actually in use
-        if is_port_in_use(port):
-            # Try to discover what's using it
-            if session := self._discovery.scan_single_port(port):
-                return (False, session)
-            # Port in use but can't identify
-            return (False, None)
+        # Then check if port is actually in use; a free port is refused
+        # straight away, so this is the only probe in the common case
+        if not is_port_in_use(port, timeout=LIVENESS_TIMEOUT):
+            return (True, None)
 
-        return (True, None)
+        # Try to discover what's using it with a single DevTools probe
+        if session := self._discovery.scan_single_port(port):
+            return (False, session)
+        # Port in use but can't identify
+        return (False, None)
 
     def check_and_prompt(
         self,
@@ -352,28 +787,19 @@ def default_conflict_prompt(port: int, existing: Optional[Session]) -> str:
         User's chosen action
     """
     if existing:
-        print(f"\nPort {port} is in use by: {existing.app_name}")
-        print(f"  Session ID: {existing.session_id[:8]}...")
-        print(f"  Origin: {existing.origin.value}")
-        print(f"  Status: {existing.status.value}")
+        header = (
+            f"\nPort {port} is in use by: {existing.app_name}\n"
+            f"  Session ID: {existing.session_id[:8]}...\n"
+            f"  Origin: {existing.origin.value}\n"
+            f"  Status: {existing.status.value}"
+        )
     else:
-        print(f"\nPort {port} is in use by an unknown process")
+        header = f"\nPort {port} is in use by an unknown process"
 
-    print("\nOptions:")
-    print("  [a]dd    - Add to registry and track")
-    print("  [i]gnore - Proceed without tracking")
-    print("  [k]ill   - Kill existing and take over")
-    print("  [c]ancel - Abort operation")
+    print(f"{header}\n{CONFLICT_PROMPT_OPTIONS}")
 
     while True:
         choice = input("\nChoice [a/i/k/c]: ").strip().lower()
-        if choice in ("a", "add"):
-            return CONFLICT_ACTION_ADD
-        elif choice in ("i", "ignore"):
-            return CONFLICT_ACTION_IGNORE
-        elif choice in ("k", "kill"):
-            return CONFLICT_ACTION_KILL
-        elif choice in ("c", "cancel", ""):
-            return CONFLICT_ACTION_CANCEL
-        else:
-            print("Invalid choice. Please enter a, i, k, or c.")
+        if (action := CONFLICT_PROMPT_CHOICES.get(choice)) is not None:
+            return action
+        print("Invalid choice. Please enter a, i, k, or c.")
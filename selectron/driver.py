@@ -4,14 +4,18 @@ Selectron Electron Driver Manager
 Main interface for managing Electron app automation via Selenium.
 """
 
+import fcntl
 import json
+import mmap
 import re
 import subprocess
+import threading
 import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Any, Iterator, List
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -29,6 +33,7 @@ from .discovery import (
     PortConflictHandler,
     is_port_in_use,
     default_conflict_prompt,
+    LIVENESS_TIMEOUT,
     CONFLICT_ACTION_KILL,
     CONFLICT_ACTION_CANCEL,
     CONFLICT_ACTION_IGNORE,
@@ -42,6 +47,97 @@ from .exceptions import (
 )
 
 
+# Embedded version marker, e.g. b"Chrome/138.0.7204.251 Electron/37.10.3"
+CHROME_VERSION_PATTERN = re.compile(rb'Chrome/(\d+\.\d+\.\d+\.\d+)\s+Electron/')
+
+# Backoff for polling the DevTools port after launching an app (seconds)
+STARTUP_POLL_INITIAL = 0.01
+STARTUP_POLL_MAX = 0.2
+
+
+# Serializes port selection and app launch within this process; the lock
+# file next to the registry's sessions file does the same across processes.
+_PORT_ALLOC_LOCK = threading.Lock()
+PORT_ALLOC_LOCK_NAME = "port-alloc.lock"
+
+
+@contextmanager
+def _port_allocation_lock(lock_path: Path) -> Iterator[None]:
+    """
+    Hold the in-process and cross-process port allocation locks.
+
+    Args:
+        lock_path: Lock file shared by every process using the same registry
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with _PORT_ALLOC_LOCK, open(lock_path, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _load_version_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load persisted per-framework version entries.
+
+    Args:
+        path: Path to the versions cache file
+
+    Returns:
+        Dict mapping framework path to its cached entry (empty if unavailable)
+    """
+    if not path.exists():
+        return {}
+
+    try:
+        with open(path, "r") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            try:
+                data = json.load(f)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return data.get("frameworks", {})
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not load version cache: {e}")
+        return {}
+
+
+def _save_version_cache(path: Path, frameworks: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Persist per-framework version entries with file locking.
+
+    Args:
+        path: Path to the versions cache file
+        frameworks: Dict mapping framework path to its cached entry
+    """
+    data = {
+        "version": 1,
+        "updated_at": datetime.now().isoformat(),
+        "frameworks": frameworks,
+    }
+
+    # Atomic write with file locking
+    temp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "w") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                json.dump(data, f, indent=2)
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        temp_path.replace(path)
+    except IOError as e:
+        print(f"Warning: Could not persist version cache: {e}")
+        if temp_path.exists():
+            temp_path.unlink()
+
+
 class ElectronDriverManager:
     """
     Manages ChromeDriver installation and session lifecycle for Electron apps.
@@ -133,9 +229,10 @@ class ElectronDriverManager:
         self._discovery = SessionDiscovery(self._registry)
         self._conflict_handler = PortConflictHandler(self._registry, self._discovery)
 
-        # Cached values
+        # Cached values (also persisted across runs in config.versions_file)
         self._chrome_version: Optional[str] = None
         self._driver_path: Optional[Path] = None
+        self._versions_file = config.versions_file
 
         # Current session
         self._current_session: Optional[Session] = None
@@ -158,12 +255,62 @@ class ElectronDriverManager:
         """The process monitor."""
         return self._monitor
 
+    def _framework_fingerprint(self) -> Optional[List[int]]:
+        """Return (mtime_ns, size) of the Electron Framework, or None if unreadable."""
+        try:
+            st = self.paths.electron_framework.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def _cached_versions(self, fingerprint: Optional[List[int]]) -> Dict[str, Any]:
+        """
+        Look up the persisted entry for this app's framework.
+
+        Args:
+            fingerprint: Current framework fingerprint from _framework_fingerprint()
+
+        Returns:
+            The cached entry, or an empty dict if missing or the framework changed
+        """
+        if fingerprint is None:
+            return {}
+        entry = _load_version_cache(self._versions_file).get(
+            str(self.paths.electron_framework), {}
+        )
+        return entry if entry.get("fingerprint") == fingerprint else {}
+
+    def _update_version_cache(self, fingerprint: Optional[List[int]], **fields: str) -> None:
+        """
+        Merge fields into the persisted entry for this app's framework.
+
+        An entry recorded against a different fingerprint is replaced rather
+        than merged, so a stale driver_path never outlives an app update.
+
+        Args:
+            fingerprint: Framework fingerprint the fields were derived from
+            **fields: Values to store (chrome_version, driver_path)
+        """
+        if fingerprint is None:
+            return
+        frameworks = _load_version_cache(self._versions_file)
+        key = str(self.paths.electron_framework)
+        entry = frameworks.get(key, {})
+        if entry.get("fingerprint") != fingerprint:
+            entry = {"fingerprint": fingerprint}
+        entry.update(fields)
+        frameworks[key] = entry
+        _save_version_cache(self._versions_file, frameworks)
+
     def get_chrome_version(self) -> str:
         """
         Extract the Chrome version embedded in the Electron app.
 
-        Uses the `strings` command to search the Electron Framework binary
-        for the Chrome version string (e.g., "Chrome/138.0.7204.251").
+        Memory-maps the Electron Framework binary and searches it for the
+        Chrome version string (e.g., "Chrome/138.0.7204.251").
+
+        The result is persisted per framework path and reused until the
+        framework's mtime or size changes.
 
         Returns:
             Full Chrome version string (e.g., "138.0.7204.251")
@@ -180,24 +327,34 @@ class ElectronDriverManager:
                 "Framework file not found"
             )
 
+        fingerprint = self._framework_fingerprint()
+        if version := self._cached_versions(fingerprint).get("chrome_version"):
+            self._chrome_version = version
+            return self._chrome_version
+
+        # Map the binary read-only and scan the bytes in place; only the
+        # pages the regex touches are read, and nothing is decoded.
         try:
-            process = subprocess.run(
-                ["strings", str(self.paths.electron_framework)],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            with open(self.paths.electron_framework, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = CHROME_VERSION_PATTERN.search(mm)
+                # Read the group before the map is closed
+                version = match.group(1).decode("ascii") if match else None
+        except ValueError:
+            # mmap refuses zero-length files
+            raise ChromeVersionError(
+                self.paths.electron_framework,
+                "Framework file is empty"
             )
-        except subprocess.TimeoutExpired:
+        except OSError as e:
             raise ChromeVersionError(
                 self.paths.electron_framework,
-                "Timeout reading framework binary"
+                f"Could not read framework binary: {e}"
             )
 
-        # Look for pattern like "Chrome/138.0.7204.251 Electron/37.10.3"
-        match = re.search(r'Chrome/(\d+\.\d+\.\d+\.\d+)\s+Electron/', process.stdout)
-
-        if match:
-            self._chrome_version = match.group(1)
+        if version:
+            self._chrome_version = version
+            self._update_version_cache(fingerprint, chrome_version=version)
             return self._chrome_version
 
         raise ChromeVersionError(
@@ -213,6 +370,9 @@ class ElectronDriverManager:
         """
         Install the matching ChromeDriver version using selenium-manager.
 
+        A driver path persisted for the current framework is reused as long
+        as the executable still exists.
+
         Args:
             force: If True, re-download even if cached
 
@@ -225,6 +385,14 @@ class ElectronDriverManager:
         if self._driver_path and not force:
             return self._driver_path
 
+        fingerprint = self._framework_fingerprint()
+        if not force:
+            cached_path = self._cached_versions(fingerprint).get("driver_path")
+            if cached_path and Path(cached_path).exists():
+                self._driver_path = Path(cached_path)
+                print(f"Using cached ChromeDriver at: {self._driver_path}")
+                return self._driver_path
+
         major_version = self.get_major_version()
         print(f"Detected Chrome version: {self.get_chrome_version()}")
         print(f"Requesting ChromeDriver for Chrome {major_version}...")
@@ -257,6 +425,11 @@ class ElectronDriverManager:
             if driver_path := data.get("result", {}).get("driver_path"):
                 self._driver_path = Path(driver_path)
                 print(f"ChromeDriver installed at: {self._driver_path}")
+                self._update_version_cache(
+                    fingerprint,
+                    chrome_version=self.get_chrome_version(),
+                    driver_path=str(self._driver_path),
+                )
                 return self._driver_path
         except json.JSONDecodeError:
             pass
@@ -290,17 +463,22 @@ class ElectronDriverManager:
 
         Raises:
             SessionStartError: If the app fails to start
+            PortConflictError: If another launch takes the port first
+                               (only without auto_find_port)
         """
-        # Auto-find port if requested
         if auto_find_port:
-            debugging_port = find_available_port(debugging_port)
+            # A port picked as free has no conflict to resolve; races with
+            # other launches are caught again under the allocation lock
+            debugging_port = self._find_free_port(debugging_port)
             print(f"Using port {debugging_port}")
-
-        # Check for port conflict
-        action, existing = self._conflict_handler.check_and_prompt(
-            debugging_port,
-            on_conflict or default_conflict_prompt
-        )
+            action, existing = "available", None
+        else:
+            # Check for port conflict. This may prompt the user, so it runs
+            # outside the port allocation lock.
+            action, existing = self._conflict_handler.check_and_prompt(
+                debugging_port,
+                on_conflict or default_conflict_prompt
+            )
 
         if action == "available":
             pass  # Port is free, continue
@@ -323,50 +501,90 @@ class ElectronDriverManager:
             # Just tracking existing
             return existing
 
-        # Start the process
-        args = [str(self.paths.binary), f"--remote-debugging-port={debugging_port}"]
-        print(f"Starting: {' '.join(args)}")
+        # Claim the port under the allocation lock and keep holding it until
+        # the app is listening. Other processes can't see our registry, so
+        # until then nothing else tells them the port is taken.
+        lock_path = self._registry.persistence_path.parent / PORT_ALLOC_LOCK_NAME
+        with _port_allocation_lock(lock_path):
+            # Another launch may have taken the port since it was checked
+            if not self._port_is_free(debugging_port):
+                if not auto_find_port:
+                    raise PortConflictError(
+                        debugging_port, self._registry.get_by_port(debugging_port)
+                    )
+                debugging_port = self._find_free_port(debugging_port)
+                print(f"Using port {debugging_port}")
+
+            # Start the process
+            args = [str(self.paths.binary), f"--remote-debugging-port={debugging_port}"]
+            print(f"Starting: {' '.join(args)}")
+
+            try:
+                # Detach the app from our terminal: its log output can't fill
+                # a pipe we never read, and a SIGHUP to our session won't reach it
+                proc = subprocess.Popen(
+                    args,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                    close_fds=True,
+                )
+            except OSError as e:
+                raise SessionStartError(self.app_name, debugging_port, str(e))
+
+            # Create session record
+            session = Session(
+                session_id=str(uuid.uuid4()),
+                port=debugging_port,
+                app_name=self.app_name,
+                pid=proc.pid,
+                started_at=datetime.now(),
+                started_by="selectron",
+                origin=SessionOrigin.OURS,
+                status=SessionStatus.RUNNING,
+                app_bundle_path=self.paths.app_bundle,
+                chrome_version=self._chrome_version,
+            )
 
-        try:
-            proc = subprocess.Popen(args)
-        except OSError as e:
-            raise SessionStartError(self.app_name, debugging_port, str(e))
-
-        # Create session record
-        session = Session(
-            session_id=str(uuid.uuid4()),
-            port=debugging_port,
-            app_name=self.app_name,
-            pid=proc.pid,
-            started_at=datetime.now(),
-            started_by="selectron",
-            origin=SessionOrigin.OURS,
-            status=SessionStatus.RUNNING,
-            app_bundle_path=self.paths.app_bundle,
-            chrome_version=self._chrome_version,
+            # Register and track
+            try:
+                self._registry.register(session)
+                self._monitor.track_process(session, proc)
+            except PortConflictError:
+                proc.terminate()
+                raise
+
+            # Wait for port to become available, polling quickly at first and
+            # backing off so a slow start doesn't keep waking us up
+            delay = STARTUP_POLL_INITIAL
+            deadline = time.monotonic() + wait_seconds
+            while (remaining := deadline - time.monotonic()) > 0:
+                if is_port_in_use(debugging_port, timeout=LIVENESS_TIMEOUT):
+                    print(f"App started, DevTools listening on port {debugging_port}")
+                    self._current_session = session
+                    return session
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 1.5, STARTUP_POLL_MAX)
+
+            print(f"Warning: Port {debugging_port} not open after {wait_seconds}s")
+            self._current_session = session
+            return session
+
+    def _find_free_port(self, start_port: int) -> int:
+        """Find the first port from start_port that is neither listening nor registered."""
+        port = find_available_port(start_port)
+        while self._registry.get_by_port(port) is not None:
+            port = find_available_port(port + 1)
+        return port
+
+    def _port_is_free(self, port: int) -> bool:
+        """Check that no registered session or listening process holds a port."""
+        return (
+            self._registry.get_by_port(port) is None
+            and not is_port_in_use(port, timeout=LIVENESS_TIMEOUT)
         )
 
-        # Register and track
-        try:
-            self._registry.register(session)
-            self._monitor.track_process(session, proc)
-        except PortConflictError:
-            proc.terminate()
-            raise
-
-        # Wait for port to become available
-        deadline = time.time() + wait_seconds
-        while time.time() < deadline:
-            if is_port_in_use(debugging_port):
-                print(f"App started, DevTools listening on port {debugging_port}")
-                self._current_session = session
-                return session
-            time.sleep(0.1)
-
-        print(f"Warning: Port {debugging_port} not open after {wait_seconds}s")
-        self._current_session = session
-        return session
-
     def stop_session(self, session_id: Optional[str] = None, timeout: float = 5.0) -> bool:
         """
         Stop a debugging session.
@@ -429,18 +647,8 @@ class ElectronDriverManager:
         Raises:
             ValueError: If no port is specified and no current session exists
         """
-        port = debugging_port
-        if port is None:
-            if self._current_session:
-                port = self._current_session.port
-            else:
-                port = 9222  # Default fallback
-
         driver_path = self.install()
-
-        options = Options()
-        options.binary_location = str(self.paths.binary)
-        options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+        options = self.get_options(debugging_port)
 
         service = Service(executable_path=str(driver_path))
 
@@ -467,16 +675,7 @@ class ElectronDriverManager:
         Raises:
             ValueError: If no port is specified and no current session exists
         """
-        port = debugging_port
-        if port is None:
-            if self._current_session:
-                port = self._current_session.port
-            else:
-                port = 9222  # Default fallback
-
-        options = Options()
-        options.binary_location = str(self.paths.binary)
-        options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+        options = self.get_options(debugging_port)
 
         return webdriver.Remote(
             command_executor=server_url,
@@ -493,18 +692,21 @@ class ElectronDriverManager:
         Returns:
             Chrome Options instance
         """
-        port = debugging_port
-        if port is None:
-            if self._current_session:
-                port = self._current_session.port
-            else:
-                port = 9222
+        port = self._resolve_port(debugging_port)
 
         options = Options()
         options.binary_location = str(self.paths.binary)
         options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
         return options
 
+    def _resolve_port(self, debugging_port: Optional[int]) -> int:
+        """Return the explicit port, else the current session's, else 9222."""
+        if debugging_port is not None:
+            return debugging_port
+        if self._current_session:
+            return self._current_session.port
+        return 9222  # Default fallback
+
     def scan_for_external_sessions(self) -> list:
         """
         Scan for externally-started debugging sessions.
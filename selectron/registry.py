@@ -9,7 +9,7 @@ import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Iterator, List, Dict
+from typing import Optional, Iterator, List, Dict, FrozenSet
 
 from .models import Session, SessionStatus, SessionOrigin
 from .config import get_config
@@ -26,6 +26,7 @@ class SessionRegistry:
     Features:
         - Thread-safe with RLock (reentrant lock)
         - O(1) port lookups via port index
+        - Lock-free snapshot of registered ports
         - Atomic file writes with file locking
         - Auto-load from disk on startup
 
@@ -45,6 +46,7 @@ class SessionRegistry:
         """
         self._sessions: Dict[str, Session] = {}  # session_id -> Session
         self._port_index: Dict[int, str] = {}    # port -> session_id (for fast lookup)
+        self._known_ports: FrozenSet[int] = frozenset()  # Immutable copy of port index keys
         self._lock = threading.RLock()           # Reentrant lock for thread safety
         self._persistence_path = persistence_path or get_config().sessions_file
 
@@ -54,6 +56,11 @@ class SessionRegistry:
         # Load persisted sessions on startup
         self._load_from_disk()
 
+    @property
+    def persistence_path(self) -> Path:
+        """Path of the file sessions are persisted to."""
+        return self._persistence_path
+
     def register(self, session: Session) -> None:
         """
         Add a session to the registry.
@@ -72,6 +79,7 @@ class SessionRegistry:
 
             self._sessions[session.session_id] = session
             self._port_index[session.port] = session.session_id
+            self._known_ports = frozenset(self._port_index)
             self._persist_to_disk()
 
     def unregister(self, session_id: str) -> Optional[Session]:
@@ -87,6 +95,7 @@ class SessionRegistry:
         with self._lock:
             if session := self._sessions.pop(session_id, None):
                 self._port_index.pop(session.port, None)
+                self._known_ports = frozenset(self._port_index)
                 self._persist_to_disk()
                 return session
             return None
@@ -103,6 +112,15 @@ class SessionRegistry:
                 return self._sessions.get(session_id)
             return None
 
+    def known_ports_snapshot(self) -> FrozenSet[int]:
+        """
+        Get the ports of all registered sessions.
+
+        Reads an immutable set that is swapped in on every change, so no
+        lock is taken; suited to membership checks in hot loops.
+        """
+        return self._known_ports
+
     def get_by_app(self, app_name: str) -> List[Session]:
         """Get all sessions for a given app name."""
         with self._lock:
@@ -179,6 +197,7 @@ class SessionRegistry:
         with self._lock:
             self._sessions.clear()
             self._port_index.clear()
+            self._known_ports = frozenset()
             self._persist_to_disk()
 
     def _persist_to_disk(self) -> None:
@@ -230,6 +249,8 @@ class SessionRegistry:
                     # Log and skip corrupted entries
                     print(f"Warning: Could not load session: {e}")
 
+            self._known_ports = frozenset(self._port_index)
+
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load sessions file: {e}")
 
@@ -237,21 +258,27 @@ class SessionRegistry:
         """
         Verify the status of all sessions by checking if their ports are in use.
 
+        All unverified ports are checked in a single bulk liveness sweep.
+
         Returns:
             Dict mapping session_id to verified status
         """
-        from .utils import is_port_in_use
+        from .utils import find_ports_in_use
 
         results = {}
         with self._lock:
-            for session_id, session in list(self._sessions.items()):
-                if session.status == SessionStatus.UNKNOWN:
-                    if is_port_in_use(session.port):
-                        session.status = SessionStatus.RUNNING
-                    else:
-                        session.status = SessionStatus.TERMINATED
-                        self.unregister(session_id)
-                    results[session_id] = session.status
+            unverified = [
+                session for session in self._sessions.values()
+                if session.status == SessionStatus.UNKNOWN
+            ]
+            live_ports = find_ports_in_use(session.port for session in unverified)
+            for session in unverified:
+                if session.port in live_ports:
+                    session.status = SessionStatus.RUNNING
+                else:
+                    session.status = SessionStatus.TERMINATED
+                    self.unregister(session.session_id)
+                results[session.session_id] = session.status
 
         return results
 
@@ -4,9 +4,21 @@ Selectron Utilities
 Shared utility functions for the Selectron library.
 """
 
+import errno
 import platform
+import selectors
 import socket
+import time
 from pathlib import Path
+from typing import Iterable, Set
+
+
+# Connect timeout for liveness checks; closed local ports are refused immediately
+LIVENESS_TIMEOUT = 0.05
+
+# Sockets opened at once by find_ports_in_use(); stays well under the default
+# macOS file descriptor limit of 256
+BULK_CONNECT_BATCH = 128
 
 
 def get_selenium_manager_path() -> Path:
@@ -39,22 +51,77 @@ def get_selenium_manager_path() -> Path:
     return sm_path
 
 
-def is_port_in_use(port: int, host: str = "localhost") -> bool:
+def is_port_in_use(port: int, host: str = "localhost", timeout: float = 0.5) -> bool:
     """
     Check if a port is currently in use.
 
     Args:
         port: Port number to check
         host: Host to check (default: localhost)
+        timeout: Connect timeout in seconds
 
     Returns:
         True if the port is in use, False otherwise
     """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.settimeout(0.5)
+        s.settimeout(timeout)
         return s.connect_ex((host, port)) == 0
 
 
+def find_ports_in_use(
+    ports: Iterable[int],
+    host: str = "localhost",
+    timeout: float = LIVENESS_TIMEOUT,
+) -> Set[int]:
+    """
+    Find which ports accept TCP connections, connecting to all of them at once.
+
+    Non-blocking connects are issued in batches and awaited together with a
+    selector, so a sweep costs about one timeout window per batch rather
+    than one connect per port.
+
+    Args:
+        ports: Ports to check
+        host: Host to check (default: localhost)
+        timeout: Time to wait for each batch of connects
+
+    Returns:
+        Set of ports with something listening
+    """
+    address = socket.gethostbyname(host)
+    ports = list(ports)
+    open_ports: Set[int] = set()
+
+    for i in range(0, len(ports), BULK_CONNECT_BATCH):
+        sockets = []
+        with selectors.DefaultSelector() as selector:
+            try:
+                for port in ports[i:i + BULK_CONNECT_BATCH]:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sockets.append(sock)
+                    sock.setblocking(False)
+                    err = sock.connect_ex((address, port))
+                    if err == 0:
+                        open_ports.add(port)
+                    elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, port)
+
+                deadline = time.monotonic() + timeout
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            open_ports.add(key.data)
+                        selector.unregister(key.fileobj)
+            finally:
+                for sock in sockets:
+                    sock.close()
+
+    return open_ports
+
+
 def find_available_port(start_port: int = 9222, max_attempts: int = 100) -> int:
     """
     Find an available port starting from start_port.